@@ -0,0 +1,33 @@
+import argparse
+import time
+
+from sgr.config.constants import OFFER_REFRESH_INTERVAL_SECONDS
+from sgr.store.offer_table import OfferTable
+
+
+def refresh_offers(interval: float, once: bool = False):
+    # Runs beside the session writers so pricing requests only ever read offers
+    offers = OfferTable()
+    while True:
+        updated = offers.refresh_incremental()
+        metrics = offers.get_metrics()
+        if updated:
+            print(
+                f"🏷️ Refreshed {updated} offers "
+                f"({metrics.get('last_refresh_rows_per_second') or 0:.0f} rows/s), "
+                f"{metrics.get('pending_changes')} changes pending, "
+                f"{metrics.get('deferred_users')} users deferred."
+            )
+        if once:
+            return
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply pending session changes.")
+    parser.add_argument(
+        "--interval", type=float, default=OFFER_REFRESH_INTERVAL_SECONDS
+    )
+    parser.add_argument("--once", action="store_true", help="Refresh once and exit.")
+    args = parser.parse_args()
+    refresh_offers(args.interval, args.once)
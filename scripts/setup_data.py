@@ -3,6 +3,8 @@ import duckdb
 import random
 import os
 
+from sgr.store.offer_table import OfferTable
+
 DATA_DIR = "data"
 SQL_DIR = "sgr/store/sql"
 
@@ -64,6 +66,12 @@ def create_dummy_data():
     con_sql.close()
     print("✅ Databases populated with dummy data.")
 
+    # --- 3. Rebuild Precomputed Offers ---
+    # Full rebuild after the nightly refresh; session edits apply incrementally
+    print("🏷️ Rebuilding precomputed offers...")
+    count = OfferTable(db_path, sql_path).rebuild()
+    print(f"✅ Precomputed {count} offers.")
+
 
 if __name__ == "__main__":
     create_dummy_data()
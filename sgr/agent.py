@@ -2,7 +2,8 @@
 
 This module implements the main pricing agent that orchestrates:
 1. Intent routing (pricing vs general queries)
-2. User context retrieval from hybrid feature store
+2. User context retrieval from the precomputed offer table, falling back
+   to the hybrid feature store
 3. LLM-powered pricing decisions with schema enforcement
 
 The agent follows Single Responsibility Principle - it only handles
@@ -18,10 +19,11 @@ from .models.schemas import PricingLogic, RouterSchema
 from .prompts.pricing import ASSISTANT_FETCH_MESSAGE, build_pricing_context_prompt
 from .prompts.routing import build_routing_prompt
 from .store.hybrid_store import HybridFeatureStore
+from .store.offer_table import OfferTable
 from .utils.llm_client import LLMClient
 
 
-def pricing_agent(user_query: str, user_id: str) -> str:
+def pricing_agent(user_query: str, user_id: str, compact: bool = False) -> str:
     """Process a user pricing query and return an appropriate response.
 
     This is the main entry point for the pricing negotiation system.
@@ -31,6 +33,8 @@ def pricing_agent(user_query: str, user_id: str) -> str:
     Args:
         user_query: The user's message/request.
         user_id: Unique identifier for the user.
+        compact: Use compact reasoning mode with shorter analysis fields
+            and a tighter token budget for the pricing phase.
 
     Returns:
         A string response - either a discount offer or general reply.
@@ -38,6 +42,7 @@ def pricing_agent(user_query: str, user_id: str) -> str:
     # Initialize dependencies (singleton patterns handle efficiency)
     llm = LLMClient()
     feature_store = HybridFeatureStore()
+    offer_table = OfferTable()
 
     # Build conversation history
     history = [
@@ -56,7 +61,9 @@ def pricing_agent(user_query: str, user_id: str) -> str:
     # --- Phase 2: Context Retrieval ---
     if decision.action.tool_name == "fetch_user_features":
         print(f"   🔍 fetching features for {user_id}...")
-        context = feature_store.get_user_context(user_id)
+        # O(1) read; empty if the offer is missing or has pending changes
+        precomputed = offer_table.get_offer(user_id)
+        context = precomputed or feature_store.get_user_context(user_id)
 
         if not context:
             return "Error: User profile not found."
@@ -65,6 +72,11 @@ def pricing_agent(user_query: str, user_id: str) -> str:
             f"      [Data] LTV: ${context.get('user_ltv')} (DuckDB) | "
             f"Margin: {context.get('cart_profit_margin', 0) * 100}% (SQLite)"
         )
+        if precomputed:
+            print(
+                f"      [Data] Precomputed offer: {precomputed['offer_code']} "
+                f"(max {precomputed['max_discount_percent']}%)"
+            )
 
         # Extract values with defaults
         churn_prob = context.get("churn_probability", DEFAULT_CHURN_PROBABILITY)
@@ -82,17 +94,38 @@ def pricing_agent(user_query: str, user_id: str) -> str:
                     cart_val=cart_val,
                     margin=margin,
                     user_ltv=user_ltv,
+                    compact=compact,
+                    max_discount_percent=precomputed.get("max_discount_percent"),
+                    offer_code=precomputed.get("offer_code"),
                 ),
             }
         )
 
         # --- Phase 3: SGR Logic Execution ---
         print("   🧠 Calculating Offer (Schema Enforced)...")
-        offer = llm.run_sgr(history, PricingLogic)
+        # Precomputed offers are pinned in the grammar, so the model cannot
+        # emit other values and writes customer_message after seeing them
+        fixed_values = (
+            {
+                "max_discount_percent": precomputed["max_discount_percent"],
+                "offer_code": precomputed["offer_code"],
+            }
+            if precomputed
+            else None
+        )
+        offer = llm.run_sgr(
+            history, PricingLogic, compact=compact, fixed_values=fixed_values
+        )
 
         # Audit Log (The SGR Benefit: explicit reasoning traces)
         print(f"      [Audit] Math: {offer.margin_math}")
         print(f"      [Audit] Max Allowed: {offer.max_discount_percent}%")
+        usage = llm.get_token_usage().get(PricingLogic.__name__)
+        if usage:
+            print(
+                f"      [Audit] Field chars (cumulative, {usage.calls} calls): "
+                f"{usage.field_chars}"
+            )
 
         return offer.customer_message
 
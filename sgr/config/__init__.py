@@ -1,6 +1,7 @@
 """Configuration module for SGR discount manager."""
 
 from .constants import (
+    COMPACT_PRICING_FIELD_MAX_LENGTHS,
     DATA_DIR,
     DEFAULT_API_BASE_URL,
     DEFAULT_API_KEY,
@@ -9,14 +10,23 @@ from .constants import (
     DEFAULT_MODEL,
     DEFAULT_PROFIT_MARGIN,
     DEFAULT_TEMPERATURE,
+    HIGH_CHURN_MARGIN_SHARE,
     HIGH_CHURN_THRESHOLD,
+    LOW_CHURN_MAX_DISCOUNT_PERCENT,
     LOW_CHURN_THRESHOLD,
+    MIN_CHARS_PER_TOKEN,
+    OFFER_CODE_PREFIX,
+    OFFER_REFRESH_INTERVAL_SECONDS,
     OFFLINE_STORE_PATH,
     ONLINE_STORE_PATH,
+    PRICING_FIELD_MAX_LENGTHS,
+    SCHEMA_OVERHEAD_TOKENS,
     SQL_DIR,
+    TRUNCATION_RETRY_MULTIPLIER,
 )
 
 __all__ = [
+    "COMPACT_PRICING_FIELD_MAX_LENGTHS",
     "DATA_DIR",
     "DEFAULT_API_BASE_URL",
     "DEFAULT_API_KEY",
@@ -25,9 +35,17 @@ __all__ = [
     "DEFAULT_MODEL",
     "DEFAULT_PROFIT_MARGIN",
     "DEFAULT_TEMPERATURE",
+    "HIGH_CHURN_MARGIN_SHARE",
     "HIGH_CHURN_THRESHOLD",
+    "LOW_CHURN_MAX_DISCOUNT_PERCENT",
     "LOW_CHURN_THRESHOLD",
+    "MIN_CHARS_PER_TOKEN",
+    "OFFER_CODE_PREFIX",
+    "OFFER_REFRESH_INTERVAL_SECONDS",
     "OFFLINE_STORE_PATH",
     "ONLINE_STORE_PATH",
+    "PRICING_FIELD_MAX_LENGTHS",
+    "SCHEMA_OVERHEAD_TOKENS",
     "SQL_DIR",
+    "TRUNCATION_RETRY_MULTIPLIER",
 ]
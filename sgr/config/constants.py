@@ -20,6 +20,36 @@ DEFAULT_MODEL: str = "Qwen/Qwen2.5-1.5B-Instruct"
 DEFAULT_TEMPERATURE: float = 0.1
 """Temperature for LLM inference (low for deterministic responses)."""
 
+# =============================================================================
+# Generation Budgets
+# =============================================================================
+MIN_CHARS_PER_TOKEN: float = 2.0
+"""Pessimistic chars-per-token ratio used to derive max_tokens from maxLength."""
+
+SCHEMA_OVERHEAD_TOKENS: int = 64
+"""Token allowance for JSON keys, punctuation and numeric fields."""
+
+TRUNCATION_RETRY_MULTIPLIER: int = 2
+"""A response that hits max_tokens is retried once with this times the cap."""
+
+PRICING_FIELD_MAX_LENGTHS: dict[str, int] = {
+    "churn_analysis": 240,
+    "financial_analysis": 240,
+    "margin_math": 120,
+    "offer_code": 16,
+    "customer_message": 400,
+}
+"""Per-field character limits pushed into the PricingLogic guided schema."""
+
+COMPACT_PRICING_FIELD_MAX_LENGTHS: dict[str, int] = {
+    "churn_analysis": 80,
+    "financial_analysis": 80,
+    "margin_math": 60,
+    "offer_code": 16,
+    "customer_message": 240,
+}
+"""Per-field character limits for PricingLogic in compact reasoning mode."""
+
 # =============================================================================
 # Data Paths
 # =============================================================================
@@ -55,3 +85,18 @@ DEFAULT_CART_VALUE: float = 100.0
 
 DEFAULT_PROFIT_MARGIN: float = 0.2
 """Default profit margin (20%) when data is unavailable."""
+
+# =============================================================================
+# Business Rules - Precomputed Offers
+# =============================================================================
+HIGH_CHURN_MARGIN_SHARE: float = 0.5
+"""Share of the profit margin offered as discount to high-churn users."""
+
+LOW_CHURN_MAX_DISCOUNT_PERCENT: float = 5.0
+"""Discount cap in percent for low-churn users."""
+
+OFFER_CODE_PREFIX: str = "SAVE"
+"""Prefix for generated offer codes (e.g. SAVE12)."""
+
+OFFER_REFRESH_INTERVAL_SECONDS: float = 5.0
+"""Polling interval for the incremental offer refresh worker."""
@@ -24,12 +24,30 @@ BUSINESS RULES:
 
 Respond with your analysis and offer as JSON."""
 
+COMPACT_REASONING_INSTRUCTION = """
+
+COMPACT MODE: Keep churn_analysis and financial_analysis to a few words each,
+write margin_math as a single equation, and keep customer_message to one or
+two sentences."""
+"""Appended to the pricing prompt when compact reasoning mode is enabled."""
+
+PRECOMPUTED_OFFER_INSTRUCTION = """
+
+PRECOMPUTED OFFER (already validated against the business rules):
+- max_discount_percent: {max_discount_percent}
+- offer_code: {offer_code}
+Use exactly these values in your response."""
+"""Appended to the pricing prompt when a precomputed offer is available."""
+
 
 def build_pricing_context_prompt(
     churn_prob: float,
     cart_val: float,
     margin: float,
     user_ltv: float,
+    compact: bool = False,
+    max_discount_percent: float | None = None,
+    offer_code: str | None = None,
 ) -> str:
     """Build the pricing context prompt with user data.
 
@@ -38,11 +56,14 @@ def build_pricing_context_prompt(
         cart_val: Current cart value in dollars.
         margin: Profit margin as decimal (e.g., 0.2 for 20%).
         user_ltv: User's lifetime value in dollars.
+        compact: Ask for terse analysis fields to cut decode time.
+        max_discount_percent: Precomputed discount cap, if available.
+        offer_code: Precomputed offer code, if available.
 
     Returns:
         Formatted prompt with user data and business rules.
     """
-    return USER_DATA_TEMPLATE.format(
+    prompt = USER_DATA_TEMPLATE.format(
         churn_prob=churn_prob,
         cart_val=cart_val,
         margin_percent=margin * 100,
@@ -50,3 +71,11 @@ def build_pricing_context_prompt(
         high_churn_threshold=HIGH_CHURN_THRESHOLD,
         low_churn_threshold=LOW_CHURN_THRESHOLD,
     )
+    if max_discount_percent is not None and offer_code is not None:
+        prompt += PRECOMPUTED_OFFER_INSTRUCTION.format(
+            max_discount_percent=max_discount_percent,
+            offer_code=offer_code,
+        )
+    if compact:
+        prompt += COMPACT_REASONING_INSTRUCTION
+    return prompt
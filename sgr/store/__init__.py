@@ -1,9 +1,11 @@
 """Hybrid feature store for user context retrieval.
 
 This module provides access to both hot (SQLite) and cold (DuckDB)
-data stores for real-time and analytical user features.
+data stores for real-time and analytical user features, plus a
+materialized table of offers precomputed from both.
 """
 
 from .hybrid_store import HybridFeatureStore
+from .offer_table import OfferTable, compute_offer
 
-__all__ = ["HybridFeatureStore"]
+__all__ = ["HybridFeatureStore", "OfferTable", "compute_offer"]
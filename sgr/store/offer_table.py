@@ -0,0 +1,415 @@
+"""Materialized offer table precomputed from the hot and cold stores.
+
+Offers only change when a user's cart, margin or nightly churn score changes,
+so they are computed ahead of time and served with a single primary-key read:
+
+- A full rebuild joins every active session (SQLite) with the analytics
+  snapshot (DuckDB). Run it after the nightly DuckDB refresh.
+- An incremental refresh recomputes only users that appear in the
+  ``session_changes`` log, which is filled by triggers on ``active_sessions``.
+  It reuses the cold features cached on the offer row, so it only touches
+  DuckDB for users that have no offer yet. Run it off the request path, e.g.
+  from ``scripts/refresh_offers.py``.
+
+Only the existing high- and low-churn rules are precomputed. Users in the
+middle churn band, users whose discount rounds below 1%, and users whose
+analytics row is missing or unreadable get no offer row, and the agent
+prices them on the live path. Unreadable or missing analytics are recorded
+in ``deferred_offers`` instead of being computed from default values.
+"""
+
+import math
+import sqlite3
+import time
+from typing import Any, ClassVar
+
+import duckdb
+
+from ..config.constants import (
+    HIGH_CHURN_MARGIN_SHARE,
+    HIGH_CHURN_THRESHOLD,
+    LOW_CHURN_MAX_DISCOUNT_PERCENT,
+    LOW_CHURN_THRESHOLD,
+    OFFER_CODE_PREFIX,
+    OFFLINE_STORE_PATH,
+    ONLINE_STORE_PATH,
+    SQL_DIR,
+)
+
+
+def compute_offer(
+    churn_probability: float, profit_margin: float
+) -> tuple[float, str] | None:
+    """Apply the high- and low-churn discount rules to a single user.
+
+    The discount is floored to a whole percent, so it matches the offer
+    code exactly and can never round past the profit margin.
+
+    Args:
+        churn_probability: User's churn probability (0.0-1.0).
+        profit_margin: Cart profit margin as decimal (e.g., 0.2 for 20%).
+
+    Returns:
+        Tuple of (max_discount_percent, offer_code), or None if no rule
+        applies (middle churn band) or the discount is below 1%.
+
+    Example:
+        >>> compute_offer(0.9, 0.25)
+        (12.0, 'SAVE12')
+    """
+    margin_percent = profit_margin * 100
+    if churn_probability > HIGH_CHURN_THRESHOLD:
+        discount = margin_percent * HIGH_CHURN_MARGIN_SHARE
+    elif churn_probability < LOW_CHURN_THRESHOLD:
+        discount = min(LOW_CHURN_MAX_DISCOUNT_PERCENT, margin_percent)
+    else:
+        return None
+    # Round away float noise first so 0.03 * 100 does not floor to 2
+    percent = math.floor(round(discount, 6))
+    if percent < 1:
+        return None
+    return float(percent), f"{OFFER_CODE_PREFIX}{percent}"
+
+
+class OfferTable:
+    """Precomputed per-user offers stored alongside the hot store.
+
+    Attributes:
+        duck_path: Path to the DuckDB analytical (cold) store.
+        sql_path: Path to the SQLite operational (hot) store holding the table.
+
+    Example:
+        >>> offers = OfferTable()
+        >>> offer = offers.get_offer("user_102")
+    """
+
+    MISSING_ANALYTICS: ClassVar[str] = "missing_analytics"
+    """Deferral reason: DuckDB has no analytics row for the user."""
+
+    COLD_STORE_ERROR: ClassVar[str] = "cold_store_error"
+    """Deferral reason: the DuckDB lookup failed."""
+
+    SCHEMA_OBJECTS: ClassVar[tuple[str, ...]] = (
+        "precomputed_offers",
+        "session_changes",
+        "offer_refresh_state",
+        "deferred_offers",
+        "idx_session_changes_user_id",
+        "active_sessions_log_insert",
+        "active_sessions_log_update",
+        "active_sessions_log_delete",
+    )
+    """Tables, index and triggers created by ``setup_offers.sql``."""
+
+    def __init__(
+        self,
+        duck_path: str = OFFLINE_STORE_PATH,
+        sql_path: str = ONLINE_STORE_PATH,
+    ) -> None:
+        """Initialize the offer table.
+
+        No I/O happens here; the schema is created by ``rebuild`` and
+        ``refresh_incremental`` so the request path only ever reads.
+
+        Args:
+            duck_path: Path to the DuckDB store.
+            sql_path: Path to the SQLite store.
+        """
+        self.duck_path = duck_path
+        self.sql_path = sql_path
+
+    def _load_sql(self, filename: str) -> str:
+        with open(f"{SQL_DIR}/{filename}", "r") as f:
+            return f.read()
+
+    def _ensure_schema(self) -> None:
+        """Create offer tables and change-log triggers if any are missing.
+
+        Checked against ``sqlite_master`` on every refresh, because recreating
+        ``active_sessions`` (see ``setup_sqlite.sql``) silently drops the
+        triggers that feed the change log.
+        """
+        try:
+            with sqlite3.connect(self.sql_path) as con:
+                found = {
+                    row[0]
+                    for row in con.execute(
+                        self._load_sql("list_schema_objects.sql")
+                    ).fetchall()
+                }
+                if not found.issuperset(self.SCHEMA_OBJECTS):
+                    con.executescript(self._load_sql("setup_offers.sql"))
+        except Exception as e:
+            print(f"⚠️ Offer Table Error: {e}")
+
+    def _fetch_cold(self, user_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Look up cold features in DuckDB, omitting users without a row.
+
+        Unlike ``HybridFeatureStore``, errors propagate so callers can tell
+        an unavailable store apart from a real lookup.
+        """
+        if not user_ids:
+            return {}
+        query = self._load_sql("get_analytics.sql")
+        cold = {}
+        with duckdb.connect(self.duck_path, read_only=True) as duck:
+            for user_id in user_ids:
+                row = duck.execute(query, [user_id]).fetchone()
+                if row:
+                    cold[user_id] = {"user_ltv": row[0], "churn_probability": row[1]}
+        return cold
+
+    def _build_row(
+        self, user_id: str, cold: dict[str, Any], hot: dict[str, Any], now: float
+    ) -> tuple | None:
+        churn = cold["churn_probability"]
+        offer = compute_offer(churn, hot["cart_profit_margin"])
+        if offer is None:
+            return None
+        discount, code = offer
+        return (
+            user_id,
+            cold["user_ltv"],
+            churn,
+            hot["current_cart_value"],
+            hot["cart_profit_margin"],
+            hot["inventory_status"],
+            discount,
+            code,
+            now,
+        )
+
+    def _record_refresh(
+        self,
+        con: sqlite3.Connection,
+        head: int,
+        rows: int,
+        started: float,
+        full: bool,
+    ) -> None:
+        """Trim the consumed change log and store refresh bookkeeping.
+
+        Throughput and timing stats are only overwritten by a full rebuild
+        or an incremental refresh that changed at least one offer, so idle
+        or fully deferred cycles do not reset them.
+        """
+        now = time.time()
+        con.execute(self._load_sql("trim_session_changes.sql"), (head,))
+        if not full and not rows:
+            con.execute(self._load_sql("advance_change_log.sql"), (head,))
+            return
+        con.execute(
+            self._load_sql("update_refresh_state.sql"),
+            (
+                head,
+                now if full else None,
+                None if full else now,
+                rows,
+                now - started,
+            ),
+        )
+
+    def _read_offer(self, con: sqlite3.Connection, user_id: str) -> dict[str, Any]:
+        row = con.execute(self._load_sql("get_offer.sql"), (user_id,)).fetchone()
+        if not row:
+            return {}
+        return {
+            "user_id": user_id,
+            "user_ltv": row[0],
+            "churn_probability": row[1],
+            "current_cart_value": row[2],
+            "cart_profit_margin": row[3],
+            "inventory_status": row[4],
+            "max_discount_percent": row[5],
+            "offer_code": row[6],
+            "refreshed_at": row[7],
+        }
+
+    def get_offer(self, user_id: str) -> dict[str, Any]:
+        """Read a user's precomputed offer and cached context.
+
+        This is two indexed reads and never recomputes anything. An offer
+        whose user still has pending session changes is stale and is not
+        returned.
+
+        Returns:
+            Dict with the same keys as ``HybridFeatureStore.get_user_context``
+            plus ``max_discount_percent``, ``offer_code`` and
+            ``refreshed_at``, or an empty dict if no fresh offer exists.
+        """
+        try:
+            with sqlite3.connect(self.sql_path) as con:
+                pending = con.execute(
+                    self._load_sql("has_pending_change.sql"), (user_id,)
+                ).fetchone()[0]
+                if pending:
+                    return {}
+                return self._read_offer(con, user_id)
+        except Exception as e:
+            print(f"⚠️ Offer Table Error: {e}")
+            return {}
+
+    def rebuild(self) -> int:
+        """Recompute every offer from the joined hot and cold stores.
+
+        Intended to run after the nightly DuckDB refresh, since cold
+        features cached on offer rows are only updated here. Sessions
+        without an analytics row are recorded as deferred.
+
+        Returns:
+            Number of offers written.
+        """
+        started = time.time()
+        self._ensure_schema()
+        try:
+            with duckdb.connect(self.duck_path, read_only=True) as duck:
+                cold = {
+                    row[0]: {"user_ltv": row[1], "churn_probability": row[2]}
+                    for row in duck.execute(
+                        self._load_sql("get_all_analytics.sql")
+                    ).fetchall()
+                }
+            with sqlite3.connect(self.sql_path) as con:
+                head = con.execute(self._load_sql("get_change_head.sql")).fetchone()[0]
+                rows, deferred = [], []
+                for user_id, cart, margin, inventory in con.execute(
+                    self._load_sql("get_all_sessions.sql")
+                ).fetchall():
+                    if user_id not in cold:
+                        deferred.append((user_id, self.MISSING_ANALYTICS, started))
+                        continue
+                    hot = {
+                        "current_cart_value": cart,
+                        "cart_profit_margin": margin,
+                        "inventory_status": inventory,
+                    }
+                    row = self._build_row(user_id, cold[user_id], hot, started)
+                    if row:
+                        rows.append(row)
+                con.execute(self._load_sql("clear_offers.sql"))
+                con.executemany(self._load_sql("upsert_offer.sql"), rows)
+                con.execute(self._load_sql("clear_deferred_offers.sql"))
+                con.executemany(self._load_sql("upsert_deferred_offer.sql"), deferred)
+                self._record_refresh(con, head, len(rows), started, full=True)
+            return len(rows)
+        except Exception as e:
+            print(f"⚠️ Offer Rebuild Error: {e}")
+            return 0
+
+    def refresh_incremental(self) -> int:
+        """Recompute offers for users whose session changed since last refresh.
+
+        Users without a cached offer need cold features from DuckDB. If the
+        lookup fails or the user has no analytics row, they are recorded in
+        ``deferred_offers`` instead of being priced from default values.
+        They are retried on their next session change or the next rebuild.
+
+        Returns:
+            Number of offers recomputed or removed (0 when the log is empty).
+        """
+        started = time.time()
+        self._ensure_schema()
+        try:
+            with sqlite3.connect(self.sql_path) as con:
+                state = con.execute(self._load_sql("get_refresh_state.sql")).fetchone()
+                head = con.execute(self._load_sql("get_change_head.sql")).fetchone()[0]
+                if head <= state[0]:
+                    return 0
+
+                changed = [
+                    row[0]
+                    for row in con.execute(
+                        self._load_sql("get_changed_users.sql"), (state[0], head)
+                    ).fetchall()
+                ]
+                session_sql = self._load_sql("get_session.sql")
+                sessions = {
+                    user_id: con.execute(session_sql, (user_id,)).fetchone()
+                    for user_id in changed
+                }
+                # Cold features only change nightly; reuse the cached copy
+                cold = {
+                    user_id: self._read_offer(con, user_id)
+                    for user_id, session in sessions.items()
+                    if session
+                }
+                missing = [user_id for user_id, row in cold.items() if not row]
+                reason = self.MISSING_ANALYTICS
+                try:
+                    cold.update(self._fetch_cold(missing))
+                except Exception as e:
+                    print(f"⚠️ DuckDB Error: {e}")
+                    reason = self.COLD_STORE_ERROR
+
+                applied = 0
+                for user_id, session in sessions.items():
+                    if session and not cold[user_id]:
+                        con.execute(
+                            self._load_sql("upsert_deferred_offer.sql"),
+                            (user_id, reason, started),
+                        )
+                        continue
+                    con.execute(self._load_sql("delete_deferred_offer.sql"), (user_id,))
+                    row = None
+                    if session:
+                        hot = {
+                            "current_cart_value": session[0],
+                            "cart_profit_margin": session[1],
+                            "inventory_status": session[2],
+                        }
+                        row = self._build_row(user_id, cold[user_id], hot, started)
+                    if row:
+                        con.execute(self._load_sql("upsert_offer.sql"), row)
+                    else:
+                        # Session ended or no rule applies: serve the live path
+                        con.execute(self._load_sql("delete_offer.sql"), (user_id,))
+                    applied += 1
+
+                self._record_refresh(con, head, applied, started, full=False)
+            return applied
+        except Exception as e:
+            print(f"⚠️ Offer Refresh Error: {e}")
+            return 0
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Report staleness and refresh-throughput metrics.
+
+        Returns:
+            Dict with ``offer_count``, ``pending_changes`` (change-log rows
+            not yet applied), ``deferred_users`` (sessions waiting on cold
+            features), ``oldest_offer_age_seconds``,
+            ``seconds_since_full_rebuild``, ``seconds_since_incremental``,
+            ``last_refresh_rows``, ``last_refresh_seconds`` and
+            ``last_refresh_rows_per_second``. Empty if the table is unavailable.
+        """
+        now = time.time()
+        try:
+            with sqlite3.connect(self.sql_path) as con:
+                state = con.execute(self._load_sql("get_refresh_state.sql")).fetchone()
+                pending = con.execute(
+                    self._load_sql("count_pending_changes.sql"), (state[0],)
+                ).fetchone()[0]
+                offer_count, oldest = con.execute(
+                    self._load_sql("get_offer_stats.sql")
+                ).fetchone()
+                deferred = con.execute(
+                    self._load_sql("count_deferred_offers.sql")
+                ).fetchone()[0]
+        except Exception as e:
+            print(f"⚠️ Offer Table Error: {e}")
+            return {}
+
+        _, full_at, incremental_at, rows, seconds = state
+        return {
+            "offer_count": offer_count,
+            "pending_changes": pending,
+            "deferred_users": deferred,
+            "oldest_offer_age_seconds": now - oldest if oldest else None,
+            "seconds_since_full_rebuild": now - full_at if full_at else None,
+            "seconds_since_incremental": (
+                now - incremental_at if incremental_at else None
+            ),
+            "last_refresh_rows": rows,
+            "last_refresh_seconds": seconds,
+            "last_refresh_rows_per_second": rows / seconds if seconds else None,
+        }
@@ -0,0 +1,3 @@
+UPDATE offer_refresh_state
+SET last_change_id = ?
+WHERE id = 1
@@ -0,0 +1 @@
+DELETE FROM deferred_offers
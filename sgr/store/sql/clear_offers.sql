@@ -0,0 +1 @@
+DELETE FROM precomputed_offers
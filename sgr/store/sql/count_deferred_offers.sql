@@ -0,0 +1,2 @@
+SELECT COUNT(*) AS deferred_count
+FROM deferred_offers
@@ -0,0 +1,3 @@
+SELECT COUNT(*)
+FROM session_changes
+WHERE change_id > ?
@@ -0,0 +1,2 @@
+DELETE FROM deferred_offers
+WHERE user_id = ?
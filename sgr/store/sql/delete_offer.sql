@@ -0,0 +1,2 @@
+DELETE FROM precomputed_offers
+WHERE user_id = ?
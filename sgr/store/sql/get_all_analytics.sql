@@ -0,0 +1,5 @@
+SELECT
+    user_id,
+    user_ltv,
+    churn_probability
+FROM user_analytics
@@ -0,0 +1,6 @@
+SELECT
+    user_id,
+    current_cart_value,
+    cart_profit_margin,
+    inventory_status
+FROM active_sessions
@@ -0,0 +1,2 @@
+SELECT COALESCE(MAX(change_id), 0)
+FROM session_changes
@@ -0,0 +1,3 @@
+SELECT DISTINCT user_id
+FROM session_changes
+WHERE change_id > ? AND change_id <= ?
@@ -0,0 +1,11 @@
+SELECT
+    user_ltv,
+    churn_probability,
+    current_cart_value,
+    cart_profit_margin,
+    inventory_status,
+    max_discount_percent,
+    offer_code,
+    refreshed_at
+FROM precomputed_offers
+WHERE user_id = ?
@@ -0,0 +1,4 @@
+SELECT
+    COUNT(*) AS offer_count,
+    MIN(refreshed_at) AS oldest_refreshed_at
+FROM precomputed_offers
@@ -0,0 +1,8 @@
+SELECT
+    last_change_id,
+    last_full_rebuild_at,
+    last_incremental_at,
+    last_refresh_rows,
+    last_refresh_seconds
+FROM offer_refresh_state
+WHERE id = 1
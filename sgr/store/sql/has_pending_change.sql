@@ -0,0 +1,3 @@
+SELECT COUNT(*) AS pending_count
+FROM session_changes
+WHERE user_id = ?
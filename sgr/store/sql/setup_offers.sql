@@ -0,0 +1,57 @@
+CREATE TABLE IF NOT EXISTS precomputed_offers (
+    user_id TEXT PRIMARY KEY,
+    user_ltv REAL,
+    churn_probability REAL,
+    current_cart_value REAL,
+    cart_profit_margin REAL,
+    inventory_status TEXT,
+    max_discount_percent REAL,
+    offer_code TEXT,
+    refreshed_at REAL           -- Unix timestamp of last recompute
+);
+
+-- Change log fed by triggers on active_sessions
+CREATE TABLE IF NOT EXISTS session_changes (
+    change_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_session_changes_user_id
+ON session_changes (user_id);
+
+-- Sessions that could not be priced because cold features were unavailable
+CREATE TABLE IF NOT EXISTS deferred_offers (
+    user_id TEXT PRIMARY KEY,
+    reason TEXT,                -- 'missing_analytics' or 'cold_store_error'
+    deferred_at REAL
+);
+
+CREATE TABLE IF NOT EXISTS offer_refresh_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    last_change_id INTEGER NOT NULL DEFAULT 0,
+    last_full_rebuild_at REAL,
+    last_incremental_at REAL,
+    last_refresh_rows INTEGER NOT NULL DEFAULT 0,
+    last_refresh_seconds REAL NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO offer_refresh_state (id) VALUES (1);
+
+CREATE TRIGGER IF NOT EXISTS active_sessions_log_insert
+AFTER INSERT ON active_sessions
+BEGIN
+    INSERT INTO session_changes (user_id) VALUES (new.user_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS active_sessions_log_update
+AFTER UPDATE ON active_sessions
+BEGIN
+    INSERT INTO session_changes (user_id) VALUES (old.user_id);
+    INSERT INTO session_changes (user_id) VALUES (new.user_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS active_sessions_log_delete
+AFTER DELETE ON active_sessions
+BEGIN
+    INSERT INTO session_changes (user_id) VALUES (old.user_id);
+END;
@@ -0,0 +1,2 @@
+DELETE FROM session_changes
+WHERE change_id <= ?
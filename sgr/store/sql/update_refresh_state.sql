@@ -0,0 +1,8 @@
+UPDATE offer_refresh_state
+SET
+    last_change_id = ?,
+    last_full_rebuild_at = COALESCE(?, last_full_rebuild_at),
+    last_incremental_at = COALESCE(?, last_incremental_at),
+    last_refresh_rows = ?,
+    last_refresh_seconds = ?
+WHERE id = 1
@@ -0,0 +1 @@
+INSERT OR REPLACE INTO deferred_offers VALUES (?, ?, ?)
@@ -0,0 +1 @@
+INSERT OR REPLACE INTO precomputed_offers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -1,6 +1,6 @@
 """Utility functions for the SGR discount manager."""
 
 from .json_utils import strip_markdown_json
-from .llm_client import LLMClient
+from .llm_client import GenerationProfile, LLMClient, TokenUsage
 
-__all__ = ["strip_markdown_json", "LLMClient"]
+__all__ = ["strip_markdown_json", "LLMClient", "GenerationProfile", "TokenUsage"]
@@ -4,29 +4,104 @@ This module demonstrates Structured Generation & Reasoning (SGR) using vLLM's
 native guided decoding with xgrammar backend. The xgrammar backend enforces
 strict JSON schema constraints at the token generation level, ensuring
 100% valid structured outputs.
+
+Each schema can carry a generation profile that pushes per-field ``maxLength``
+limits into the guided JSON schema, so the grammar itself stops free-text
+fields from growing into long essays. The profile's ``max_tokens`` is derived
+from those limits and stops generation early if the output overruns them.
 """
 
 from __future__ import annotations
 
+import copy
 import json
-from typing import TYPE_CHECKING, TypeVar
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from openai import OpenAI
 
 from ..config.constants import (
+    COMPACT_PRICING_FIELD_MAX_LENGTHS,
     DEFAULT_API_BASE_URL,
     DEFAULT_API_KEY,
     DEFAULT_MODEL,
     DEFAULT_TEMPERATURE,
+    MIN_CHARS_PER_TOKEN,
+    PRICING_FIELD_MAX_LENGTHS,
+    SCHEMA_OVERHEAD_TOKENS,
+    TRUNCATION_RETRY_MULTIPLIER,
 )
+from ..models.schemas import PricingLogic
 from .json_utils import strip_markdown_json
 
 if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletion
     from pydantic import BaseModel
 
 T = TypeVar("T", bound="BaseModel")
 
 
+@dataclass(frozen=True)
+class GenerationProfile:
+    """Decode budget applied to a single schema.
+
+    Attributes:
+        field_max_lengths: Character limits injected as ``maxLength`` into
+            the matching top-level string properties of the guided schema.
+    """
+
+    field_max_lengths: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def max_tokens(self) -> int:
+        """Completion token cap derived from the field limits.
+
+        Sized so a response that fills every limited field still fits,
+        assuming a pessimistic chars-per-token ratio plus JSON overhead.
+        """
+        chars = sum(self.field_max_lengths.values())
+        return math.ceil(chars / MIN_CHARS_PER_TOKEN) + SCHEMA_OVERHEAD_TOKENS
+
+
+@dataclass
+class TokenUsage:
+    """Accumulated token usage for one schema, used to tune budgets.
+
+    Attributes:
+        calls: Number of completion requests, including truncated attempts.
+        prompt_tokens: Total prompt tokens reported by the server.
+        completion_tokens: Total completion tokens reported by the server.
+        truncated_calls: Requests that stopped because they hit max_tokens.
+        field_chars: Characters generated per top-level field value, in the
+            same unit as the ``maxLength`` limits.
+        field_tokens: Estimated completion tokens per top-level field. Each
+            field's key, value and separators are attributed by their share
+            of the output, so the fields add up to the completion tokens of
+            every response that parsed (truncated attempts are excluded).
+    """
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    truncated_calls: int = 0
+    field_chars: dict[str, int] = field(default_factory=dict)
+    field_tokens: dict[str, int] = field(default_factory=dict)
+
+
+DEFAULT_PROFILES: dict[type[BaseModel], GenerationProfile] = {
+    PricingLogic: GenerationProfile(field_max_lengths=PRICING_FIELD_MAX_LENGTHS),
+}
+"""Generation profiles keyed by schema class (standard mode)."""
+
+COMPACT_PROFILES: dict[type[BaseModel], GenerationProfile] = {
+    PricingLogic: GenerationProfile(
+        field_max_lengths=COMPACT_PRICING_FIELD_MAX_LENGTHS
+    ),
+}
+"""Generation profiles keyed by schema class (compact reasoning mode)."""
+
+
 class LLMClient:
     """Wrapper for OpenAI-compatible LLM inference with schema enforcement.
 
@@ -36,6 +111,9 @@ class LLMClient:
     Attributes:
         client: The underlying OpenAI client instance.
         model: The model ID to use for inference.
+        profiles: Generation profiles for standard mode, by schema class.
+        compact_profiles: Generation profiles for compact mode, by schema class.
+        token_usage: Accumulated token usage, by schema name.
 
     Example:
         >>> from sgr.models.schemas import RouterSchema
@@ -74,6 +152,11 @@ class LLMClient:
             api_key=api_key or DEFAULT_API_KEY,
         )
         self.model = self._get_available_model()
+        self.profiles: dict[type[BaseModel], GenerationProfile] = dict(DEFAULT_PROFILES)
+        self.compact_profiles: dict[type[BaseModel], GenerationProfile] = dict(
+            COMPACT_PROFILES
+        )
+        self.token_usage: dict[str, TokenUsage] = {}
         self._initialized = True
 
     def _get_available_model(self) -> str:
@@ -90,23 +173,125 @@ class LLMClient:
             pass
         return DEFAULT_MODEL
 
-    def run_sgr(self, messages: list[dict], schema_class: type[T]) -> T:
+    def get_profile(
+        self, schema_class: type[BaseModel], compact: bool = False
+    ) -> GenerationProfile | None:
+        """Resolve the generation profile for a schema.
+
+        Compact mode falls back to the standard profile.
+
+        Args:
+            schema_class: Pydantic model class being generated.
+            compact: Whether to prefer the compact reasoning profile.
+
+        Returns:
+            The generation profile to apply, or None if the schema has no
+            profile and should be generated without limits.
+        """
+        if compact and schema_class in self.compact_profiles:
+            return self.compact_profiles[schema_class]
+        return self.profiles.get(schema_class)
+
+    def get_token_usage(self) -> dict[str, TokenUsage]:
+        """Return accumulated token usage keyed by schema name."""
+        return self.token_usage
+
+    def reset_token_usage(self) -> None:
+        """Clear accumulated token usage statistics."""
+        self.token_usage = {}
+
+    @staticmethod
+    def _constrain_schema(
+        schema_dict: dict,
+        field_max_lengths: dict[str, int],
+        fixed_values: dict[str, Any],
+    ) -> dict:
+        """Return a copy of the schema with field limits and fixed values.
+
+        Limited string fields get ``maxLength``; fixed fields get ``const``
+        so the grammar can only emit the given value.
+        """
+        if not field_max_lengths and not fixed_values:
+            return schema_dict
+        constrained = copy.deepcopy(schema_dict)
+        for name, prop in constrained.get("properties", {}).items():
+            if name in field_max_lengths and prop.get("type") == "string":
+                prop["maxLength"] = field_max_lengths[name]
+            if name in fixed_values:
+                prop["const"] = fixed_values[name]
+        return constrained
+
+    def _record_usage(
+        self, schema_name: str, completion: ChatCompletion, clean_json: str
+    ) -> None:
+        """Accumulate server-reported usage and per-field size statistics."""
+        stats = self.token_usage.setdefault(schema_name, TokenUsage())
+        stats.calls += 1
+        if completion.choices[0].finish_reason == "length":
+            stats.truncated_calls += 1
+
+        try:
+            payload = json.loads(clean_json)
+        except json.JSONDecodeError:
+            payload = None
+        if isinstance(payload, dict):
+            for name, value in payload.items():
+                chars = len(value) if isinstance(value, str) else len(json.dumps(value))
+                stats.field_chars[name] = stats.field_chars.get(name, 0) + chars
+
+        usage = completion.usage
+        if usage is None:
+            return
+        stats.prompt_tokens += usage.prompt_tokens
+        stats.completion_tokens += usage.completion_tokens
+        if not isinstance(payload, dict) or not payload:
+            return
+
+        # Spread completion tokens over each field's serialized key and value
+        segments = {
+            name: len(json.dumps({name: value})) for name, value in payload.items()
+        }
+        total = sum(segments.values())
+        for name, size in segments.items():
+            stats.field_tokens[name] = stats.field_tokens.get(name, 0) + round(
+                size / total * usage.completion_tokens
+            )
+
+    def run_sgr(
+        self,
+        messages: list[dict],
+        schema_class: type[T],
+        compact: bool = False,
+        fixed_values: dict[str, Any] | None = None,
+    ) -> T:
         """Run inference with Schema-Guided Response constraints.
 
         Injects the Pydantic schema into the system prompt and validates
-        the response against the schema.
+        the response against the schema. The schema's generation profile
+        sets ``max_tokens`` and the ``maxLength`` limits on its fields. If
+        the response still hits ``max_tokens``, it is regenerated once with
+        a larger, still bounded cap.
 
         Args:
             messages: List of message dicts with 'role' and 'content' keys.
             schema_class: Pydantic model class to validate response against.
+            compact: Use the compact reasoning profile when one exists.
+            fixed_values: Top-level field values the model must reproduce
+                verbatim, enforced as ``const`` in the guided schema.
 
         Returns:
             Validated instance of the schema_class.
 
         Raises:
-            ValidationError: If the response doesn't match the schema.
+            ValidationError: If the response doesn't match the schema,
+                including when the retry is truncated as well.
         """
-        schema_dict = schema_class.model_json_schema()
+        profile = self.get_profile(schema_class, compact)
+        schema_dict = self._constrain_schema(
+            schema_class.model_json_schema(),
+            profile.field_max_lengths if profile else {},
+            fixed_values or {},
+        )
         schema_json = json.dumps(schema_dict, indent=2)
         enhanced_messages = messages.copy()
 
@@ -123,16 +308,27 @@ class LLMClient:
         # Use vLLM's native guided_json with xgrammar backend
         # This enforces strict schema constraints at the token generation level
         # See: https://docs.vllm.ai/en/latest/features/structured_outputs.html
-        completion = self.client.chat.completions.create(
-            model=self.model,
-            messages=enhanced_messages,
-            temperature=DEFAULT_TEMPERATURE,
-            extra_body={
+        request = {
+            "model": self.model,
+            "messages": enhanced_messages,
+            "temperature": DEFAULT_TEMPERATURE,
+            "extra_body": {
                 "guided_json": schema_dict,
                 "guided_decoding_backend": "xgrammar",
             },
-        )
+        }
+        if profile:
+            request["max_tokens"] = profile.max_tokens
+        completion = self.client.chat.completions.create(**request)
+
+        # Early stop cut the JSON short: record the attempt and retry once
+        # with a larger cap so a runaway numeric field stays bounded
+        if profile and completion.choices[0].finish_reason == "length":
+            self._record_usage(schema_class.__name__, completion, "")
+            request["max_tokens"] = profile.max_tokens * TRUNCATION_RETRY_MULTIPLIER
+            completion = self.client.chat.completions.create(**request)
 
         raw_response = completion.choices[0].message.content
-        clean_json = strip_markdown_json(raw_response)
+        clean_json = strip_markdown_json(raw_response or "")
+        self._record_usage(schema_class.__name__, completion, clean_json)
         return schema_class.model_validate_json(clean_json)